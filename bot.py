@@ -6,17 +6,31 @@ re-assign the autorole to all members.
 """
 from __future__ import annotations
 
+import asyncio
+import atexit
 import enum
+import hashlib
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import re
+import socket
+import sqlite3
+import string
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Coroutine, Iterator, List
 
+import aiohttp
 import discord
+import orjson
+from aiohttp import web
 from discord import app_commands
 from discord.ext import commands
 from dotenv import load_dotenv
@@ -24,31 +38,48 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(asctime)s] %(levelname)s %(name)s: %(message)s",
+_LOG_QUEUE: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+_LOG_STREAM_HANDLER = logging.StreamHandler()
+_LOG_STREAM_HANDLER.setFormatter(
+    logging.Formatter("[%(asctime)s] %(levelname)s %(name)s: %(message)s")
 )
+LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, _LOG_STREAM_HANDLER)
+LOG_LISTENER.start()
+atexit.register(LOG_LISTENER.stop)
+# Not basicConfig: it would give the queue handler a formatter and format twice.
+logging.root.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
+logging.root.setLevel(logging.INFO)
 LOGGER = logging.getLogger("autorole")
 
 _config: BotConfig | None = None
+_GUILD_ID: int | None = None
 
-DEFAULT_CONFIG = {
+DEFAULT_CONFIG = MappingProxyType({
     "guild_id": 1443680950952394784,
     "role_id": 1444126866746245253,
     "welcome_channel_id": 1444126854553403442,
     "support_channel_id": 1444126841811112006,
     "support_team_role_id": 1444995538054418452,
-}
+})
 
 try:
     GUILD_SCOPE_ID = int(os.environ.get("DISCORD_GUILD_ID", "0")) or DEFAULT_CONFIG["guild_id"]
 except ValueError:
     GUILD_SCOPE_ID = DEFAULT_CONFIG["guild_id"]
 GUILD_OBJECT = discord.Object(id=GUILD_SCOPE_ID)
-_TREE_SYNCED = False
+
+AUTOROLE_WRITE_CONCURRENCY = 5
+AUTOROLE_REFRESH_CONCURRENCY = 3
+AUTOROLE_REFRESH_PROGRESS_INTERVAL = 500
+AUTOROLE_REFRESH_QUEUE_SIZE = 1000
+WELCOME_BATCH_WINDOW = 5.0
+WELCOME_BATCH_SIZE = 10
 
 DATA_DIR = Path("data")
-WARNINGS_FILE = DATA_DIR / "warnings.json"
+WARNINGS_DB = DATA_DIR / "warnings.db"
+LEGACY_WARNINGS_FILE = DATA_DIR / "warnings.json"
+TREE_HASH_FILE = DATA_DIR / "tree_hash"
+PANEL_STATE_FILE = DATA_DIR / "panel.json"
 
 FORBIDDEN_WORDS = [
     "nga",
@@ -63,90 +94,213 @@ FORBIDDEN_WORDS = [
     "fucking",
 ]
 
+
+def _compile_terms(words: List[str]) -> re.Pattern[str]:
+    # ``(?!)`` never matches, so an empty term list cannot flag every message.
+    return re.compile("(" + ("|".join(map(re.escape, words)) or "(?!)") + ")")
+
+
+# Pure [a-z0-9] terms survive collapsing; only the rest need the lowered text.
+_FORBIDDEN_COLLAPSED_PATTERN = _compile_terms(
+    [word for word in FORBIDDEN_WORDS if re.fullmatch(r"[a-z0-9]+", word)]
+)
+_FORBIDDEN_LOWERED_PATTERN = _compile_terms(
+    [word for word in FORBIDDEN_WORDS if not re.fullmatch(r"[a-z0-9]+", word)]
+)
+
+_MIN_FORBIDDEN_LENGTH = min(map(len, FORBIDDEN_WORDS))
+_COLLAPSE_DELETE = bytes(
+    c for c in range(128) if chr(c) not in string.ascii_lowercase + string.digits
+)
+
 FORBIDDEN_MESSAGE = (
     "Your message was removed because it contained language that violates our guidelines."
 )
 
 
-def _load_warning_store() -> Dict[str, Dict[str, List[dict[str, Any]]]]:
-    DATA_DIR.mkdir(exist_ok=True)
-    if WARNINGS_FILE.exists():
-        try:
-            with WARNINGS_FILE.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
-                if isinstance(data, dict):
-                    return data  # type: ignore[return-value]
-        except json.JSONDecodeError as exc:
-            LOGGER.warning("Failed to parse warnings file: %s", exc)
-    return {}
+_WARNINGS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS warnings (
+    id INTEGER PRIMARY KEY,
+    guild_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    moderator_id INTEGER NOT NULL,
+    reason TEXT NOT NULL,
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS warnings_member ON warnings (guild_id, user_id);
+"""
+_INSERT_WARNING = (
+    "INSERT INTO warnings (guild_id, user_id, moderator_id, reason, timestamp) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
 
 
-_WARNINGS: Dict[str, Dict[str, List[dict[str, Any]]]] = _load_warning_store()
+def _is_snowflake(value: object) -> bool:
+    """True for non-bool ints that fit SQLite's INTEGER."""
+    return type(value) is int and 0 <= value < 1 << 63
 
 
-def _save_warning_store() -> None:
+def _iter_legacy_warnings() -> Iterator[tuple[int, int, dict[str, Any]]]:
+    """Yield ``(guild_id, user_id, entry)`` from warnings.json, skipping bad data."""
+    if not LEGACY_WARNINGS_FILE.exists():
+        return
+    try:
+        data = orjson.loads(LEGACY_WARNINGS_FILE.read_bytes())
+    except (OSError, orjson.JSONDecodeError) as exc:
+        LOGGER.warning("Failed to read legacy warnings file: %s", exc)
+        return
+    if not isinstance(data, dict):
+        LOGGER.warning("Ignoring legacy warnings file without a guild mapping")
+        return
+    for guild_key, users in data.items():
+        if not isinstance(users, dict):
+            LOGGER.warning("Skipping malformed legacy warnings for guild %r", guild_key)
+            continue
+        for user_key, entries in users.items():
+            try:
+                guild_id, user_id = int(guild_key), int(user_key)
+            except ValueError:
+                guild_id = user_id = -1
+            if not (_is_snowflake(guild_id) and _is_snowflake(user_id)):
+                LOGGER.warning(
+                    "Skipping legacy warnings with bad ids %r/%r", guild_key, user_key
+                )
+                continue
+            if not isinstance(entries, list):
+                LOGGER.warning(
+                    "Skipping malformed legacy warnings for %s/%s", guild_id, user_id
+                )
+                continue
+            for entry in entries:
+                if not isinstance(entry, dict):
+                    LOGGER.warning(
+                        "Skipping malformed legacy warning for %s/%s: %r",
+                        guild_id,
+                        user_id,
+                        entry,
+                    )
+                    continue
+                moderator_id = entry.get("moderator_id")
+                reason = entry.get("reason")
+                timestamp = entry.get("timestamp")
+                yield guild_id, user_id, {
+                    "moderator_id": moderator_id if _is_snowflake(moderator_id) else 0,
+                    "reason": reason if isinstance(reason, str) else "No reason provided.",
+                    "timestamp": timestamp if isinstance(timestamp, str) else "unknown time",
+                }
+
+
+def _open_warning_store() -> sqlite3.Connection:
     DATA_DIR.mkdir(exist_ok=True)
-    with WARNINGS_FILE.open("w", encoding="utf-8") as handle:
-        json.dump(_WARNINGS, handle, indent=2)
+    connection = sqlite3.connect(WARNINGS_DB, check_same_thread=False)
+    connection.row_factory = sqlite3.Row
+    with connection:
+        connection.executescript(_WARNINGS_SCHEMA)
+        if connection.execute("SELECT 1 FROM warnings LIMIT 1").fetchone() is None:
+            rows = [
+                (
+                    guild_id,
+                    user_id,
+                    entry["moderator_id"],
+                    entry["reason"],
+                    entry["timestamp"],
+                )
+                for guild_id, user_id, entry in _iter_legacy_warnings()
+            ]
+            if rows:
+                connection.executemany(_INSERT_WARNING, rows)
+                LOGGER.info("Imported %s legacy warning(s) into %s", len(rows), WARNINGS_DB)
+    return connection
 
 
-def _record_warning(
+_WARNINGS_DB = _open_warning_store()
+_WARNINGS_DB_LOCK = threading.Lock()
+
+
+def _insert_warning(
+    guild_id: int, user_id: int, moderator_id: int, reason: str, timestamp: str
+) -> int:
+    with _WARNINGS_DB_LOCK, _WARNINGS_DB:
+        _WARNINGS_DB.execute(
+            _INSERT_WARNING, (guild_id, user_id, moderator_id, reason, timestamp)
+        )
+        (count,) = _WARNINGS_DB.execute(
+            "SELECT COUNT(*) FROM warnings WHERE guild_id = ? AND user_id = ?",
+            (guild_id, user_id),
+        ).fetchone()
+    return count
+
+
+def _select_warnings(
+    guild_id: int, user_id: int, limit: int
+) -> tuple[int, List[dict[str, Any]]]:
+    with _WARNINGS_DB_LOCK:
+        (total,) = _WARNINGS_DB.execute(
+            "SELECT COUNT(*) FROM warnings WHERE guild_id = ? AND user_id = ?",
+            (guild_id, user_id),
+        ).fetchone()
+        rows = _WARNINGS_DB.execute(
+            "SELECT moderator_id, reason, timestamp FROM warnings "
+            "WHERE guild_id = ? AND user_id = ? ORDER BY id DESC LIMIT ?",
+            (guild_id, user_id, limit),
+        ).fetchall()
+    return total, [dict(row) for row in reversed(rows)]
+
+
+async def _record_warning(
     guild_id: int,
     user_id: int,
     moderator_id: int,
     reason: str,
 ) -> int:
-    guild_key = str(guild_id)
-    user_key = str(user_id)
-    entry = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "moderator_id": moderator_id,
-        "reason": reason,
-    }
-    guild_warnings = _WARNINGS.setdefault(guild_key, {})
-    user_warnings = guild_warnings.setdefault(user_key, [])
-    user_warnings.append(entry)
-    _save_warning_store()
-    return len(user_warnings)
+    timestamp = datetime.utcnow().isoformat() + "Z"
+    return await asyncio.to_thread(
+        _insert_warning, guild_id, user_id, moderator_id, reason, timestamp
+    )
 
 
-def _get_warnings(guild_id: int, user_id: int) -> List[dict[str, Any]]:
-    return _WARNINGS.get(str(guild_id), {}).get(str(user_id), [])
+async def _get_warnings(
+    guild_id: int, user_id: int, *, limit: int = 5
+) -> tuple[int, List[dict[str, Any]]]:
+    """Return the member's warning count and their ``limit`` most recent entries."""
+    return await asyncio.to_thread(_select_warnings, guild_id, user_id, limit)
 
 
 def _contains_forbidden_text(message: str) -> tuple[bool, str | None]:
+    if len(message) < _MIN_FORBIDDEN_LENGTH:
+        return False, None
     lowered = message.lower()
-    collapsed = re.sub(r"[^a-z0-9]+", "", lowered)
-    for word in FORBIDDEN_WORDS:
-        if word in lowered or word in collapsed:
-            return True, word
+    collapsed = (
+        lowered.encode("ascii", "ignore").translate(None, _COLLAPSE_DELETE).decode()
+    )
+    match = _FORBIDDEN_COLLAPSED_PATTERN.search(collapsed)
+    if match is None and collapsed != lowered:
+        match = _FORBIDDEN_LOWERED_PATTERN.search(lowered)
+    if match:
+        return True, match.group(1)
     return False, None
 
 
-_DURATION_PATTERN = re.compile(r"(\d+)([smhd])")
+_DURATION_PATTERN = re.compile(r"(?:(\d+)d)?(?:(\d+)h)?(?:(\d+)m)?(?:(\d+)s)?")
+_DURATION_GROUP_SECONDS = (86400, 3600, 60, 1)
 _MAX_TIMEOUT = timedelta(days=28)
+_MAX_TIMEOUT_SECONDS = int(_MAX_TIMEOUT.total_seconds())
 
 
 def _parse_duration(duration: str) -> timedelta:
-    matches = _DURATION_PATTERN.findall(duration.lower())
-    if not matches:
+    match = _DURATION_PATTERN.fullmatch("".join(duration.lower().split()))
+    if match is None or not any(match.groups()):
         raise ValueError(
             "Invalid duration. Use formats like 30m, 2h, or 1h30m (s/m/h/d)."
         )
-    total = timedelta()
-    for amount, unit in matches:
-        value = int(amount)
-        if unit == "s":
-            total += timedelta(seconds=value)
-        elif unit == "m":
-            total += timedelta(minutes=value)
-        elif unit == "h":
-            total += timedelta(hours=value)
-        elif unit == "d":
-            total += timedelta(days=value)
-    if total <= timedelta(seconds=0) or total > _MAX_TIMEOUT:
+    total = sum(
+        int(amount) * seconds
+        for amount, seconds in zip(match.groups(), _DURATION_GROUP_SECONDS)
+        if amount
+    )
+    if not 1 <= total <= _MAX_TIMEOUT_SECONDS:
         raise ValueError("Duration must be between 1 second and 28 days.")
-    return total
+    return timedelta(seconds=total)
 
 
 def _assert_actionable(actor: discord.Member, target: discord.Member) -> None:
@@ -168,6 +322,30 @@ def _require_config() -> BotConfig:
     return _config
 
 
+def _coerce_int(name: str, *, default: int | None, required: bool) -> int | None:
+    value = os.environ.get(name)
+    if value is None or value.strip() == "":
+        value = str(default) if default is not None else None
+    if value is None:
+        if required:
+            raise RuntimeError(f"{name} is required.")
+        return None
+    try:
+        return int(value)
+    except ValueError as exc:
+        raise RuntimeError(f"{name} must be an integer.") from exc
+
+
+_CONFIG_INT_FIELDS = (
+    ("guild_id", "DISCORD_GUILD_ID", True),
+    ("role_id", "DISCORD_ROLE_ID", True),
+    ("welcome_channel_id", "DISCORD_WELCOME_CHANNEL_ID", False),
+    ("support_channel_id", "DISCORD_SUPPORT_CHANNEL_ID", False),
+    ("support_team_role_id", "DISCORD_SUPPORT_TEAM_ROLE_ID", False),
+    ("healthcheck_port", "HEALTHCHECK_PORT", False),
+)
+
+
 @dataclass(frozen=True)
 class BotConfig:
     token: str
@@ -176,6 +354,7 @@ class BotConfig:
     welcome_channel_id: int | None = None
     support_channel_id: int | None = None
     support_team_role_id: int | None = None
+    healthcheck_port: int | None = None
 
     @classmethod
     def from_env(cls) -> "BotConfig":
@@ -185,57 +364,65 @@ class BotConfig:
                 "DISCORD_TOKEN env var is required. Set it in .env or your process manager."
             )
 
-        def _coerce_int(name: str, *, default: int | None, required: bool) -> int | None:
-            value = os.environ.get(name)
-            if value is None or value.strip() == "":
-                value = str(default) if default is not None else None
-            if value is None:
-                if required:
-                    raise RuntimeError(f"{name} is required.")
-                return None
-            try:
-                return int(value)
-            except ValueError as exc:
-                raise RuntimeError(f"{name} must be an integer.") from exc
-
-        guild_id = _coerce_int(
-            "DISCORD_GUILD_ID", default=DEFAULT_CONFIG["guild_id"], required=True
-        )
-        role_id = _coerce_int(
-            "DISCORD_ROLE_ID", default=DEFAULT_CONFIG["role_id"], required=True
-        )
-        welcome_channel_id = _coerce_int(
-            "DISCORD_WELCOME_CHANNEL_ID",
-            default=DEFAULT_CONFIG["welcome_channel_id"],
-            required=False,
-        )
-        support_channel_id = _coerce_int(
-            "DISCORD_SUPPORT_CHANNEL_ID",
-            default=DEFAULT_CONFIG["support_channel_id"],
-            required=False,
-        )
-        support_team_role_id = _coerce_int(
-            "DISCORD_SUPPORT_TEAM_ROLE_ID",
-            default=DEFAULT_CONFIG["support_team_role_id"],
-            required=False,
-        )
-
-        return cls(
-            token=token,
-            guild_id=guild_id or 0,
-            role_id=role_id or 0,
-            welcome_channel_id=welcome_channel_id,
-            support_channel_id=support_channel_id,
-            support_team_role_id=support_team_role_id,
-        )
+        parsed = {
+            field: _coerce_int(env_name, default=DEFAULT_CONFIG.get(field), required=required)
+            for field, env_name, required in _CONFIG_INT_FIELDS
+        }
+        return cls(token=token, **parsed)  # type: ignore[arg-type]
 
 
-intents = discord.Intents.default()
-intents.members = True
+intents = discord.Intents.none()
 intents.guilds = True
+intents.members = True
+intents.guild_messages = True
 intents.message_content = True
 
-bot = commands.Bot(command_prefix="!", intents=intents)
+bot = commands.Bot(command_prefix="!", intents=intents, chunk_guilds_at_startup=False)
+
+# The loop only keeps weak references to tasks.
+_BACKGROUND_TASKS: set[asyncio.Task[None]] = set()
+
+
+def _spawn_background(coro: Coroutine[Any, Any, None]) -> None:
+    task = asyncio.create_task(coro)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+
+class TokenBucket:
+    """Pace calls to at most ``rate`` per ``per`` seconds."""
+
+    def __init__(self, rate: int, per: float) -> None:
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.rate, self._tokens + (now - self._updated) * self.rate / self.per
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.per / self.rate)
+
+
+_AUTOROLE_WRITE_SEMAPHORE = asyncio.Semaphore(AUTOROLE_WRITE_CONCURRENCY)
+_REFRESH_WRITE_SEMAPHORE = asyncio.Semaphore(AUTOROLE_REFRESH_CONCURRENCY)
+ROLE_BUCKET = TokenBucket(10, 10.0)
+REFRESH_ROLE_BUCKET = TokenBucket(10, 10.0)
+MESSAGE_BUCKET = TokenBucket(5, 5.0)
+
+_SUPPORT_CHANNEL_CACHE: dict[int, discord.TextChannel] = {}
+# None means no channel was writable.
+_WELCOME_CHANNEL_CACHE: dict[int, int | None] = {}
+_ROLE_CACHE: dict[int, discord.Role] = {}
 
 
 async def _resolve_role(guild: discord.Guild) -> discord.Role:
@@ -244,6 +431,9 @@ async def _resolve_role(guild: discord.Guild) -> discord.Role:
     if guild.id != config.guild_id:
         raise RuntimeError("Bot is configured for a different guild.")
 
+    cached = _ROLE_CACHE.get(guild.id)
+    if cached is not None:
+        return cached
     role = guild.get_role(config.role_id)
     if role is None:
         try:
@@ -256,11 +446,61 @@ async def _resolve_role(guild: discord.Guild) -> discord.Role:
         raise RuntimeError(
             f"Role id {config.role_id} is not available in guild {guild.id}."
         )
+    _ROLE_CACHE[guild.id] = role
     return role
 
 
+async def _ensure_member_cache(guild: discord.Guild) -> None:
+    """Chunk ``guild`` the first time a full member list is needed."""
+    if not guild.chunked:
+        await guild.chunk(cache=True)
+        LOGGER.info("Cached %s member(s) for guild %s", len(guild.members), guild.id)
+
+
+async def _grant_autorole(
+    member: discord.Member, role: discord.Role, *, reason: str
+) -> None:
+    """Add the autorole to a cached joining member in one full role-list PATCH."""
+    async with _AUTOROLE_WRITE_SEMAPHORE:
+        await ROLE_BUCKET.acquire()
+        # roles[0] is @everyone, which the API does not accept in the role list.
+        await member.edit(roles=[*member.roles[1:], role], reason=reason)
+
+
+async def _refresh_autorole(member: discord.Member, role: discord.Role) -> None:
+    """Add the autorole with a per-role PUT, which never touches other roles."""
+    async with _REFRESH_WRITE_SEMAPHORE:
+        await REFRESH_ROLE_BUCKET.acquire()
+        await member.add_roles(role, reason="Autorole refresh command")
+
+
 async def _resolve_welcome_channel(
     guild: discord.Guild,
+) -> discord.TextChannel | None:
+    """Resolve the welcome channel, reusing the last result for the guild."""
+    if guild.id in _WELCOME_CHANNEL_CACHE:
+        cached_id = _WELCOME_CHANNEL_CACHE[guild.id]
+        if cached_id is None:
+            return None
+        channel = guild.get_channel(cached_id)
+        me = guild.me
+        if (
+            isinstance(channel, discord.TextChannel)
+            and me
+            and channel.permissions_for(me).send_messages
+        ):
+            return channel
+        del _WELCOME_CHANNEL_CACHE[guild.id]
+
+    channel = await _find_welcome_channel(guild)
+    if channel is None:
+        LOGGER.warning("No suitable welcome channel found in guild %s", guild.id)
+    _WELCOME_CHANNEL_CACHE[guild.id] = channel.id if channel else None
+    return channel
+
+
+async def _find_welcome_channel(
+    guild: discord.Guild,
 ) -> discord.TextChannel | None:
     """Resolve the welcome channel with fallbacks."""
     config = _require_config()
@@ -311,6 +551,9 @@ async def _resolve_support_channel(
     config = _require_config()
     if not config.support_channel_id:
         return None
+    cached = _SUPPORT_CHANNEL_CACHE.get(guild.id)
+    if cached is not None:
+        return cached
     channel = guild.get_channel(config.support_channel_id)
     if channel is None:
         try:
@@ -323,6 +566,7 @@ async def _resolve_support_channel(
             )
             return None
     if isinstance(channel, discord.TextChannel):
+        _SUPPORT_CHANNEL_CACHE[guild.id] = channel
         return channel
     LOGGER.error(
         "Support channel %s is not a text channel.", config.support_channel_id
@@ -346,48 +590,100 @@ def _support_role(guild: discord.Guild) -> discord.Role | None:
 
 def _has_support_role(member: discord.Member) -> bool:
     role = _support_role(member.guild)
-    return bool(role and role in member.roles)
+    return bool(role and member.get_role(role.id) is not None)
+
+
+_ORDINAL_SUFFIXES = tuple(
+    "th" if 10 <= i <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(i % 10, "th")
+    for i in range(100)
+)
 
 
 def _format_ordinal(value: int) -> str:
-    if 10 <= value % 100 <= 20:
-        suffix = "th"
-    else:
-        suffix = {1: "st", 2: "nd", 3: "rd"}.get(value % 10, "th")
-    return f"{value}{suffix}"
+    return f"{value}{_ORDINAL_SUFFIXES[value % 100]}"
+
+
+# Embed.from_dict keeps nested values by reference; per-member keys stay fresh.
+_WELCOME_EMBED_TEMPLATE: dict[str, Any] = {
+    "type": "rich",
+    "title": "Welcome to the server!",
+    "color": discord.Color.blurple().value,
+    "fields": [
+        {
+            "name": "Getting started",
+            "value": "Check out the info channels and say hi to everyone!",
+            "inline": False,
+        }
+    ],
+}
 
 
-async def _send_welcome_message(member: discord.Member) -> None:
-    channel = await _resolve_welcome_channel(member.guild)
-    if channel is None:
-        LOGGER.warning(
-            "No suitable welcome channel found in guild %s", member.guild.id
+_WELCOME_BATCHES: dict[int, list[discord.Member]] = {}
+_WELCOME_FLUSH_HANDLES: dict[int, asyncio.TimerHandle] = {}
+
+
+def _queue_welcome_message(member: discord.Member) -> None:
+    """Add ``member`` to the guild's welcome batch, flushing it when full."""
+    guild_id = member.guild.id
+    batch = _WELCOME_BATCHES.setdefault(guild_id, [])
+    batch.append(member)
+    if len(batch) >= WELCOME_BATCH_SIZE:
+        _flush_welcome_batch(guild_id)
+    elif guild_id not in _WELCOME_FLUSH_HANDLES:
+        _WELCOME_FLUSH_HANDLES[guild_id] = asyncio.get_running_loop().call_later(
+            WELCOME_BATCH_WINDOW, _flush_welcome_batch, guild_id
         )
+
+
+def _flush_welcome_batch(guild_id: int) -> None:
+    handle = _WELCOME_FLUSH_HANDLES.pop(guild_id, None)
+    if handle is not None:
+        handle.cancel()
+    members = _WELCOME_BATCHES.pop(guild_id, None)
+    if members:
+        _spawn_background(_send_welcome_message(members))
+
+
+async def _send_welcome_message(members: List[discord.Member]) -> None:
+    guild = members[0].guild
+    channel = await _resolve_welcome_channel(guild)
+    if channel is None:
         return
 
-    member_count = member.guild.member_count or len(member.guild.members)
-    ordinal = _format_ordinal(member_count)
-    embed = discord.Embed(
-        title="Welcome to the server!",
-        description=(
-            f"{member.mention}, we're excited to have you here!\n"
-            f"You are the {ordinal} member in this community (#{member_count:,})."
-        ),
-        color=discord.Color.blurple(),
-    )
-    embed.set_thumbnail(url=member.display_avatar.url)
-    embed.add_field(
-        name="Getting started",
-        value="Check out the info channels and say hi to everyone!",
-        inline=False,
+    mentions = ", ".join(member.mention for member in members)
+    member_count = guild.member_count or guild.approximate_member_count
+    if len(members) == 1:
+        description = f"{mentions}, we're excited to have you here!"
+        if member_count:
+            description += (
+                f"\nYou are the {_format_ordinal(member_count)} member in this "
+                f"community (#{member_count:,})."
+            )
+        thumbnail = members[0].display_avatar.url
+    else:
+        description = f"{mentions}, we're excited to have you all here!"
+        if member_count:
+            description += f"\nOur community is now {member_count:,} members strong."
+        thumbnail = guild.icon.url if guild.icon else members[-1].display_avatar.url
+    embed = discord.Embed.from_dict(
+        {
+            **_WELCOME_EMBED_TEMPLATE,
+            "description": description,
+            "thumbnail": {"url": thumbnail},
+            "footer": {"text": guild.name},
+        }
     )
-    embed.set_footer(text=member.guild.name)
 
+    await MESSAGE_BUCKET.acquire()
     try:
         await channel.send(embed=embed)
-        LOGGER.info("Welcome message sent for %s in %s", member, channel)
+        LOGGER.info(
+            "Welcome message sent for %s member(s) in %s", len(members), channel
+        )
     except discord.HTTPException as exc:
-        LOGGER.error("Failed to send welcome message for %s: %s", member, exc)
+        LOGGER.error(
+            "Failed to send welcome message for %s member(s): %s", len(members), exc
+        )
 
 
 async def _guard_interaction_in_guild(
@@ -494,20 +790,36 @@ TICKET_DETAILS: dict[TicketType, dict[str, object]] = {
     },
 }
 
+_TICKET_LABEL: dict[TicketType, str] = {
+    key: details["label"] for key, details in TICKET_DETAILS.items()  # type: ignore[misc]
+}
+_TICKET_EMOJI: dict[TicketType, str] = {
+    key: details["emoji"] for key, details in TICKET_DETAILS.items()  # type: ignore[misc]
+}
+_TICKET_DESCRIPTION: dict[TicketType, str] = {
+    key: details["description"]  # type: ignore[misc]
+    for key, details in TICKET_DETAILS.items()
+}
+_TICKET_COLOR: dict[TicketType, discord.Color] = {
+    key: details["color"] for key, details in TICKET_DETAILS.items()  # type: ignore[misc]
+}
+
 SUPPORT_PANEL_FOOTER = "Support Ticket Panel • Autorole Bot"
 
 
 def _ticket_label(ticket_type: TicketType) -> str:
-    return TICKET_DETAILS[ticket_type]["label"]  # type: ignore[index]
+    return _TICKET_LABEL[ticket_type]
 
 
 def _ticket_color(ticket_type: TicketType) -> discord.Color:
-    return TICKET_DETAILS[ticket_type]["color"]  # type: ignore[index]
+    return _TICKET_COLOR[ticket_type]
+
+
+_THREAD_NAME_SEPARATORS = re.compile(r"[^a-z0-9]+")
 
 
 def _sanitize_thread_name(name: str) -> str:
-    sanitized = re.sub(r"[^a-z0-9-]+", "-", name.lower())
-    sanitized = re.sub(r"-{2,}", "-", sanitized).strip("-")
+    sanitized = _THREAD_NAME_SEPARATORS.sub("-", name.lower()).strip("-")
     if len(sanitized) < 3:
         sanitized = "ticket"
     return sanitized[:90]
@@ -566,6 +878,7 @@ async def _grant_support_team_access(thread: discord.Thread) -> None:
     role = _support_role(guild)
     if role is None:
         return
+    await _ensure_member_cache(guild)
     for supporter in role.members:
         if supporter.bot:
             continue
@@ -627,7 +940,7 @@ class TicketReasonModal(discord.ui.Modal):
 
 class ApplicationModal(discord.ui.Modal):
     def __init__(self, application_type: TicketType):
-        title = f"{TICKET_DETAILS[application_type]['label']} Request"
+        title = f"{_ticket_label(application_type)} Request"
         super().__init__(title=title)
         self.application_type = application_type
         self.username = discord.ui.TextInput(
@@ -699,7 +1012,7 @@ class ApplicationModal(discord.ui.Modal):
             "Experience": self.experience.value,
             "Highlights / Links": self.portfolio.value,
             "Availability": self.availability.value,
-            "Application type": TICKET_DETAILS[self.application_type]["label"],
+            "Application type": _ticket_label(self.application_type),
         }
         try:
             thread = await _create_ticket_thread(
@@ -730,13 +1043,12 @@ class TicketTypeSelect(discord.ui.Select):
             TicketType.BUILDER,
         )
         for ticket_type in selectable:
-            details = TICKET_DETAILS[ticket_type]
             options.append(
                 discord.SelectOption(
-                    label=details["label"],
+                    label=_TICKET_LABEL[ticket_type],
                     value=ticket_type.value,
-                    description=details["description"],
-                    emoji=details["emoji"],
+                    description=_TICKET_DESCRIPTION[ticket_type],
+                    emoji=_TICKET_EMOJI[ticket_type],
                 )
             )
         super().__init__(
@@ -765,7 +1077,7 @@ class StaffApplicationButton(discord.ui.Button):
         super().__init__(
             label="Staff/Creator App",
             style=discord.ButtonStyle.primary,
-            emoji=TICKET_DETAILS[TicketType.STAFF]["emoji"],
+            emoji=_TICKET_EMOJI[TicketType.STAFF],
             custom_id="support_panel:application",
         )
 
@@ -780,12 +1092,35 @@ class SupportPanelView(discord.ui.View):
         self.add_item(StaffApplicationButton())
 
 
-async def ensure_support_panel(guild: discord.Guild) -> None:
-    channel = await _resolve_support_channel(guild)
-    if channel is None:
-        LOGGER.warning("Support channel not configured; skipping ticket panel.")
-        return
+def _ticket_option_lines(*ticket_types: TicketType) -> str:
+    return "\n".join(
+        f"{details['emoji']} **{details['label']}** – {details['description']}"
+        for key, details in TICKET_DETAILS.items()
+        if key in ticket_types
+    )
+
+
+# Embed.copy() is shallow, so only these strings are shared between panels.
+_SUPPORT_PANEL_FIELDS: tuple[tuple[str, str], ...] = (
+    (
+        "Support options",
+        _ticket_option_lines(TicketType.GENERAL, TicketType.PARTNER, TicketType.REPORT),
+    ),
+    (
+        "Application options",
+        _ticket_option_lines(TicketType.STAFF, TicketType.CREATOR, TicketType.BUILDER),
+    ),
+    (
+        "Application requirements",
+        "• Minimum 1k subscribers & 500 avg views (or 20+ live viewers)\n"
+        "• Strong moderation or community experience\n"
+        "• Professional and respectful conduct at all times",
+    ),
+)
+
 
+def _build_support_panel_embed(staff_tools: str) -> discord.Embed:
+    """Build a fresh ticket panel embed ending with the guild's staff field."""
     embed = discord.Embed(
         title="How can we help you?",
         description=(
@@ -795,80 +1130,174 @@ async def ensure_support_panel(guild: discord.Guild) -> None:
         ),
         color=discord.Color.dark_teal(),
     )
-    support_lines = [
-        f"{details['emoji']} **{details['label']}** – {details['description']}"
-        for key, details in TICKET_DETAILS.items()
-        if key in (TicketType.GENERAL, TicketType.PARTNER, TicketType.REPORT)
-    ]
-    application_lines = [
-        f"{details['emoji']} **{details['label']}** – {details['description']}"
-        for key, details in TICKET_DETAILS.items()
-        if key in (TicketType.STAFF, TicketType.CREATOR, TicketType.BUILDER)
-    ]
-    embed.add_field(
-        name="Support options",
-        value="\n".join(support_lines),
-        inline=False,
-    )
-    embed.add_field(
-        name="Application options",
-        value="\n".join(application_lines),
-        inline=False,
-    )
-    embed.add_field(
-        name="Application requirements",
-        value=(
-            "• Minimum 1k subscribers & 500 avg views (or 20+ live viewers)\n"
-            "• Strong moderation or community experience\n"
-            "• Professional and respectful conduct at all times"
-        ),
-        inline=False,
-    )
-    support_role = _support_role(guild)
-    staff_tools = (
-        f"{support_role.mention} can use `/ticket_claim` and `/ticket_close` inside "
-        "tickets. Everyone with this role is auto-added."
-        if support_role
-        else "Support leads can use `/ticket_claim` and `/ticket_close` inside any ticket thread."
-    )
+    for name, value in _SUPPORT_PANEL_FIELDS:
+        embed.add_field(name=name, value=value, inline=False)
     embed.add_field(name="Staff tools", value=staff_tools, inline=False)
     embed.set_footer(text=SUPPORT_PANEL_FOOTER)
+    return embed
 
-    panel_message: discord.Message | None = None
+
+def _load_panel_state() -> dict[str, dict[str, Any]]:
+    """Load the ``{guild_id: {"channel_id", "message_id", "digest"}}`` panel records."""
+    try:
+        data = orjson.loads(PANEL_STATE_FILE.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except (OSError, orjson.JSONDecodeError) as exc:
+        LOGGER.warning("Failed to read ticket panel state: %s", exc)
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_panel_state(
+    channel: discord.TextChannel, message: discord.Message, digest: str
+) -> None:
+    state = {
+        key: record for key, record in _load_panel_state().items() if isinstance(record, dict)
+    }
+    state[str(channel.guild.id)] = {
+        "channel_id": channel.id,
+        "message_id": message.id,
+        "digest": digest,
+    }
+    try:
+        DATA_DIR.mkdir(exist_ok=True)
+        PANEL_STATE_FILE.write_bytes(orjson.dumps(state))
+    except OSError as exc:
+        LOGGER.warning("Failed to store ticket panel state: %s", exc)
+
+
+def _stored_panel(channel: discord.TextChannel) -> tuple[int | None, str | None]:
+    """Return the recorded panel message id and content digest for ``channel``."""
+    record = _load_panel_state().get(str(channel.guild.id))
+    if not isinstance(record, dict) or record.get("channel_id") != channel.id:
+        return None, None
+    message_id = record.get("message_id")
+    digest = record.get("digest")
+    return (
+        message_id if isinstance(message_id, int) else None,
+        digest if isinstance(digest, str) else None,
+    )
+
+
+def _panel_digest(embed: discord.Embed, view: discord.ui.View) -> str:
+    payload = {"embed": embed.to_dict(), "components": view.to_components()}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+async def _find_pinned_panel(channel: discord.TextChannel) -> discord.Message | None:
     try:
         pinned = await channel.pins()
     except discord.HTTPException as exc:
         LOGGER.error("Failed to fetch pinned messages: %s", exc)
-        pinned = []
+        return None
     for message in pinned:
         if (
-            message.author == guild.me
+            message.author == channel.guild.me
             and message.embeds
             and SUPPORT_PANEL_FOOTER
             in (message.embeds[0].footer.text if message.embeds[0].footer else "")
         ):
-            panel_message = message
-            break
+            return message
+    return None
 
+
+async def ensure_support_panel(guild: discord.Guild) -> None:
+    channel = await _resolve_support_channel(guild)
+    if channel is None:
+        LOGGER.warning("Support channel not configured; skipping ticket panel.")
+        return
+
+    support_role = _support_role(guild)
+    staff_tools = (
+        f"{support_role.mention} can use `/ticket_claim` and `/ticket_close` inside "
+        "tickets. Everyone with this role is auto-added."
+        if support_role
+        else "Support leads can use `/ticket_claim` and `/ticket_close` inside any ticket thread."
+    )
+    embed = _build_support_panel_embed(staff_tools)
     view = SupportPanelView()
-    if panel_message:
+    digest = _panel_digest(embed, view)
+
+    panel_message: discord.Message | None = None
+    message_id, stored_digest = _stored_panel(channel)
+    if message_id is not None:
+        try:
+            panel_message = await channel.fetch_message(message_id)
+        except discord.NotFound:
+            LOGGER.info("Stored ticket panel %s is gone; posting a new one", message_id)
+        except discord.HTTPException as exc:
+            # Posting now could duplicate a panel that still exists.
+            LOGGER.error("Failed to fetch stored ticket panel %s: %s", message_id, exc)
+            return
+    else:
+        panel_message = await _find_pinned_panel(channel)
+
+    if panel_message and stored_digest == digest:
+        LOGGER.info("Ticket panel in %s is up to date", channel.id)
+    elif panel_message:
         try:
             await panel_message.edit(embed=embed, view=view)
+            _save_panel_state(channel, panel_message, digest)
             LOGGER.info("Updated existing ticket panel in %s", channel.id)
         except discord.HTTPException as exc:
             LOGGER.error("Failed to edit ticket panel: %s", exc)
     else:
         try:
             panel_message = await channel.send(embed=embed, view=view)
+            _save_panel_state(channel, panel_message, digest)
             await panel_message.pin()
             LOGGER.info("Created and pinned ticket panel in %s", channel.id)
         except discord.HTTPException as exc:
             LOGGER.error("Failed to create ticket panel: %s", exc)
 
 
+def _command_tree_hash(guild: discord.abc.Snowflake) -> str:
+    """Fingerprint the guild's command payload so unchanged trees skip sync."""
+    payload = {
+        "application_id": bot.application_id,
+        "guild_id": guild.id,
+        "commands": [
+            command.to_dict(bot.tree) for command in bot.tree.get_commands(guild=guild)
+        ],
+    }
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def _read_tree_hash() -> str | None:
+    try:
+        return TREE_HASH_FILE.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
+def _write_tree_hash(tree_hash: str) -> None:
+    try:
+        DATA_DIR.mkdir(exist_ok=True)
+        TREE_HASH_FILE.write_text(tree_hash, encoding="utf-8")
+    except OSError as exc:
+        LOGGER.warning("Failed to store slash command hash: %s", exc)
+
+
+async def _sync_command_tree() -> None:
+    """Sync the guild's slash commands unless they match the last synced set."""
+    tree_hash = _command_tree_hash(GUILD_OBJECT)
+    if _read_tree_hash() == tree_hash:
+        LOGGER.info("Slash commands unchanged for guild %s; skipping sync", GUILD_OBJECT.id)
+        return
+    try:
+        await bot.tree.sync(guild=GUILD_OBJECT)
+    except discord.HTTPException as exc:
+        LOGGER.error("Failed to sync slash commands: %s", exc)
+        return
+    LOGGER.info("Slash commands synced for guild %s", GUILD_OBJECT.id)
+    _write_tree_hash(tree_hash)
+
+
 @bot.event
 async def setup_hook() -> None:
     bot.add_view(SupportPanelView())
+    await _sync_command_tree()
 
 
 @bot.event
@@ -876,13 +1305,8 @@ async def on_message(message: discord.Message) -> None:
     if message.author.bot:
         return
 
-    try:
-        config = _require_config()
-    except RuntimeError:
-        await bot.process_commands(message)
-        return
-
-    if message.guild is None or message.guild.id != config.guild_id:
+    guild = message.guild
+    if guild is None or guild.id != _GUILD_ID:
         await bot.process_commands(message)
         return
 
@@ -895,8 +1319,8 @@ async def on_message(message: discord.Message) -> None:
             await message.delete()
         except discord.HTTPException:
             LOGGER.warning("Failed to delete flagged message from %s", message.author)
-        count = _record_warning(
-            guild_id=message.guild.id,
+        count = await _record_warning(
+            guild_id=guild.id,
             user_id=message.author.id,
             moderator_id=bot.user.id if bot.user else 0,
             reason=reason or "Automated language filter",
@@ -921,20 +1345,58 @@ async def on_ready() -> None:
     LOGGER.info("Bot connected as %s.%s", bot.user, guild_info)
     if guild:
         await ensure_support_panel(guild)
-    global _TREE_SYNCED
-    if not _TREE_SYNCED:
-        try:
-            await bot.tree.sync(guild=discord.Object(id=config.guild_id))
-            _TREE_SYNCED = True
-            LOGGER.info("Slash commands synced for guild %s", config.guild_id)
-        except discord.HTTPException as exc:
-            LOGGER.error("Failed to sync slash commands: %s", exc)
+
+
+@bot.event
+async def on_guild_channel_create(channel: discord.abc.GuildChannel) -> None:
+    _WELCOME_CHANNEL_CACHE.pop(channel.guild.id, None)
+
+
+@bot.event
+async def on_guild_channel_update(
+    before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+) -> None:
+    _WELCOME_CHANNEL_CACHE.pop(after.guild.id, None)
+
+
+@bot.event
+async def on_guild_channel_delete(channel: discord.abc.GuildChannel) -> None:
+    cached = _SUPPORT_CHANNEL_CACHE.get(channel.guild.id)
+    if cached is not None and cached.id == channel.id:
+        del _SUPPORT_CHANNEL_CACHE[channel.guild.id]
+    _WELCOME_CHANNEL_CACHE.pop(channel.guild.id, None)
+
+
+def _forget_cached_role(role: discord.Role) -> None:
+    cached = _ROLE_CACHE.get(role.guild.id)
+    if cached is not None and cached.id == role.id:
+        del _ROLE_CACHE[role.guild.id]
+
+
+@bot.event
+async def on_guild_role_update(before: discord.Role, after: discord.Role) -> None:
+    _forget_cached_role(after)
+    if before.permissions != after.permissions:
+        _WELCOME_CHANNEL_CACHE.pop(after.guild.id, None)
+
+
+@bot.event
+async def on_guild_role_delete(role: discord.Role) -> None:
+    _forget_cached_role(role)
+
+
+@bot.event
+async def on_member_update(before: discord.Member, after: discord.Member) -> None:
+    if after.id == after.guild.me.id and before.roles != after.roles:
+        _WELCOME_CHANNEL_CACHE.pop(after.guild.id, None)
 
 
 @bot.event
 async def on_member_join(member: discord.Member) -> None:
-    config = _require_config()
-    if member.guild.id != config.guild_id:
+    if member.guild.id != _GUILD_ID:
+        return
+    if member.get_role(_require_config().role_id) is not None:
+        LOGGER.debug("%s already has autorole", member)
         return
 
     try:
@@ -943,17 +1405,13 @@ async def on_member_join(member: discord.Member) -> None:
         LOGGER.error("Autorole resolution failed: %s", exc)
         return
 
-    if role in member.roles:
-        LOGGER.debug("%s already has autorole", member)
-        return
-
     try:
-        await member.add_roles(role, reason="Auto role assignment")
+        await _grant_autorole(member, role, reason="Auto role assignment")
         LOGGER.info("Assigned autorole to %s", member)
     except discord.HTTPException as exc:
         LOGGER.error("Failed to assign role to %s: %s", member, exc)
     finally:
-        await _send_welcome_message(member)
+        _queue_welcome_message(member)
 
 
 @bot.tree.command(
@@ -977,21 +1435,71 @@ async def autorole_refresh_slash(interaction: discord.Interaction) -> None:
         )
         return
 
+    pending: asyncio.Queue[discord.Member] = asyncio.Queue(AUTOROLE_REFRESH_QUEUE_SIZE)
+    processed = 0
     updated = 0
-    for member in interaction.guild.members:
-        if role not in member.roles:
+
+    async def _worker() -> None:
+        nonlocal processed, updated
+        while True:
+            member = await pending.get()
             try:
-                await member.add_roles(role, reason="Autorole refresh command")
+                await _refresh_autorole(member, role)
+                updated += 1
             except discord.HTTPException as exc:  # Continue updating others
                 LOGGER.error("Failed to add role to %s: %s", member, exc)
-                continue
-            updated += 1
+            except Exception:
+                # A dead worker would stall pending.join().
+                LOGGER.exception("Unexpected error adding role to %s", member)
+            finally:
+                pending.task_done()
+            processed += 1
+            if processed % AUTOROLE_REFRESH_PROGRESS_INTERVAL == 0:
+                try:
+                    await interaction.edit_original_response(
+                        content=f"Autorole refresh: {processed} member(s) processed so far…"
+                    )
+                except discord.HTTPException as exc:
+                    LOGGER.debug("Failed to report autorole refresh progress: %s", exc)
+
+    workers = [
+        asyncio.create_task(_worker()) for _ in range(AUTOROLE_REFRESH_CONCURRENCY)
+    ]
+    try:
+        async for member in interaction.guild.fetch_members(limit=None):
+            if member.get_role(role.id) is None:
+                await pending.put(member)
+        await pending.join()
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
 
-    await interaction.followup.send(
-        f"Autorole applied to {updated} member(s).", ephemeral=True
+    await _send_refresh_result(
+        interaction, f"Autorole applied to {updated} member(s)."
     )
 
 
+async def _send_refresh_result(interaction: discord.Interaction, content: str) -> None:
+    """Report a refresh result, falling back to the channel if the token expired."""
+    try:
+        await interaction.followup.send(content, ephemeral=True)
+        return
+    except discord.HTTPException as exc:
+        LOGGER.info("Refresh follow-up failed (%s); posting to the channel", exc)
+    channel = interaction.channel
+    if isinstance(channel, discord.abc.Messageable):
+        try:
+            await channel.send(
+                f"{interaction.user.mention} {content}",
+                allowed_mentions=discord.AllowedMentions(users=True),
+            )
+            return
+        except discord.HTTPException as exc:
+            LOGGER.error("Failed to post refresh result to %s: %s", channel, exc)
+    LOGGER.info("Autorole refresh by %s finished: %s", interaction.user, content)
+
+
 @bot.tree.command(name="ban", description="Ban a member from the server.")
 @app_commands.guilds(GUILD_OBJECT)
 @app_commands.guild_only()
@@ -1096,7 +1604,7 @@ async def slash_warn(
     config, actor = guarded
     _assert_actionable(actor, member)
     reason_text = reason or "No reason provided."
-    count = _record_warning(
+    count = await _record_warning(
         guild_id=config.guild_id,
         user_id=member.id,
         moderator_id=actor.id,
@@ -1119,8 +1627,8 @@ async def slash_warnings(
     config = await _guard_interaction_in_guild(interaction)
     if config is None or interaction.guild is None:
         return
-    entries = _get_warnings(config.guild_id, member.id)
-    if not entries:
+    total, entries = await _get_warnings(config.guild_id, member.id, limit=5)
+    if not total:
         await interaction.response.send_message(
             f"{member.mention} has no warnings on record.", ephemeral=True
         )
@@ -1128,9 +1636,9 @@ async def slash_warnings(
     embed = discord.Embed(
         title=f"Warnings for {member}",
         color=discord.Color.orange(),
-        description=f"{len(entries)} warning(s) on file.",
+        description=f"{total} warning(s) on file.",
     )
-    for entry in entries[-5:]:
+    for entry in entries:
         timestamp = entry.get("timestamp", "unknown time")
         reason = entry.get("reason", "No reason provided.")
         moderator_id = entry.get("moderator_id")
@@ -1207,12 +1715,50 @@ async def on_app_command_error(
         LOGGER.exception("Unhandled slash command error: %s", error)
         message = "Something went wrong while handling that command."
 
-    if interaction.response.is_done():
-        await interaction.followup.send(message, ephemeral=True)
-    else:
-        await interaction.response.send_message(message, ephemeral=True)
+    try:
+        if interaction.response.is_done():
+            await interaction.followup.send(message, ephemeral=True)
+        else:
+            await interaction.response.send_message(message, ephemeral=True)
+    except discord.HTTPException as exc:
+        LOGGER.error("Failed to report command error to %s: %s", interaction.user, exc)
+
+
+async def _healthz(request: web.Request) -> web.Response:
+    if bot.is_ready() and not bot.is_closed():
+        return web.Response(text="ok")
+    return web.Response(text="not ready", status=503)
+
+
+async def _start_healthcheck(port: int) -> web.AppRunner:
+    """Serve ``GET /healthz`` on ``port`` from the bot's own event loop."""
+    app = web.Application()
+    app.router.add_get("/healthz", _healthz)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, port=port).start()
+    LOGGER.info("Healthcheck listening on port %s", port)
+    return runner
+
+
+async def _run_bot(token: str, *, healthcheck_port: int | None = None) -> None:
+    # discord.py 2.4's defaults (limit=0, IPv4) plus DNS caching and keep-alive.
+    bot.http.connector = aiohttp.TCPConnector(
+        limit=0, family=socket.AF_INET, ttl_dns_cache=300, keepalive_timeout=75
+    )
+    runner = await _start_healthcheck(healthcheck_port) if healthcheck_port else None
+    try:
+        async with bot:
+            await bot.start(token)
+    finally:
+        if runner is not None:
+            await runner.cleanup()
 
 
 if __name__ == "__main__":
     _config = BotConfig.from_env()
-    bot.run(_config.token)
+    _GUILD_ID = _config.guild_id
+    try:
+        asyncio.run(_run_bot(_config.token, healthcheck_port=_config.healthcheck_port))
+    except KeyboardInterrupt:
+        pass